@@ -30,6 +30,6 @@ const links = sankeyStyle
       type: e.type ?? "is_a",
     }));
 
-// Output a clean JSON object
-process.stdout.write(JSON.stringify({ nodes, links }, null, 2));
+// Output compact JSON; indentation only adds bytes
+process.stdout.write(JSON.stringify({ nodes, links }));
 